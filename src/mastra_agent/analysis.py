@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 from typing import Iterable, List
 
 from .models import HiringSignal, LinkedInPost, LinkedInProfile, WeeklyBrief
-from .linkedin import summarize_posts
+from .linkedin import _utcnow, summarize_posts
 
 
 class HiringSignalExtractor:
@@ -27,10 +27,15 @@ class HiringSignalExtractor:
     }
 
     def extract(self, posts: Iterable[LinkedInPost]) -> List[HiringSignal]:
+        min_length = min(map(len, self.KEYWORDS), default=0)
         signals: List[HiringSignal] = []
         for post in posts:
-            content_lower = post.content.lower()
+            if len(post.content) < min_length:
+                continue
+            content_lower = post.content_lower
             matched_labels: List[str] = []
+            # One C-level substring search per keyword outperforms a single
+            # case-insensitive regex alternation for short keyword lists.
             for keyword, label in self.KEYWORDS.items():
                 if keyword in content_lower:
                     matched_labels.append(label)
@@ -46,7 +51,7 @@ def build_weekly_brief(
     posts: Iterable[LinkedInPost],
     lookback_days: int,
 ) -> WeeklyBrief:
-    posts_list = list(posts)
+    posts_list = posts if isinstance(posts, list) else list(posts)
     signals = HiringSignalExtractor().extract(posts_list)
     summary = summarize_posts(posts_list)
     return WeeklyBrief(
@@ -63,7 +68,6 @@ def filter_posts_for_window(
 ) -> List[LinkedInPost]:
     """Filter posts within the lookback window."""
 
-    posts_list = list(posts)
-    reference = reference or datetime.utcnow()
+    reference = reference or _utcnow()
     cutoff = reference - timedelta(days=lookback_days)
-    return [post for post in posts_list if post.published_at >= cutoff]
+    return [post for post in posts if post.published_at >= cutoff]
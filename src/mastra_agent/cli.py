@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Iterable
 
-from .analysis import build_weekly_brief, filter_posts_for_window
-from .config import ProjectConfig, load_config
-from .linkedin import LocalSnapshotSource
+from .analysis import build_weekly_brief
+from .config import CompanyConfig, ProjectConfig, load_config
+from .linkedin import LocalSnapshotSource, _utcnow
 from .models import LinkedInPost, WeeklyBrief
 
 
@@ -49,6 +52,12 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
         type=int,
         help="Override the lookback window defined in the configuration",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to build company briefs in parallel",
+    )
     return parser.parse_args(argv)
 
 
@@ -60,32 +69,76 @@ def _print_profiles(config: ProjectConfig) -> None:
             print(f"  - {profile.name}{title_suffix}: {profile.url}")
 
 
-def _generate_brief(
-    config: ProjectConfig, snapshot_path: Path, company_filter: str | None, lookback: int
-) -> Iterable[WeeklyBrief]:
-    source = LocalSnapshotSource(snapshot_path=snapshot_path)
+_worker_source: LocalSnapshotSource | None = None
 
-    for company in config.companies:
-        if company_filter and company.name.lower() != company_filter.lower():
-            continue
 
-        company_posts: list[LinkedInPost] = []
-        for profile in company.profiles:
-            posts = source.iter_recent_posts(profile, lookback)
-            filtered = filter_posts_for_window(posts, lookback)
-            company_posts.extend(filtered)
-
-        brief = build_weekly_brief(
-            company=company.name,
-            profiles=company.profiles,
-            posts=company_posts,
-            lookback_days=lookback,
+def _init_worker(snapshot_path: Path) -> None:
+    """Create the snapshot source shared by every task in a worker process."""
+
+    global _worker_source
+    _worker_source = LocalSnapshotSource(snapshot_path=snapshot_path)
+
+
+def _build_company_brief_in_worker(
+    company: CompanyConfig, lookback: int, reference: datetime
+) -> WeeklyBrief:
+    return _build_company_brief(company, _worker_source, lookback, reference)
+
+
+def _build_company_brief(
+    company: CompanyConfig,
+    source: LocalSnapshotSource,
+    lookback: int,
+    reference: datetime,
+) -> WeeklyBrief:
+    company_posts: list[LinkedInPost] = []
+    for profile in company.profiles:
+        company_posts.extend(source.iter_recent_posts(profile, lookback, reference))
+
+    return build_weekly_brief(
+        company=company.name,
+        profiles=company.profiles,
+        posts=company_posts,
+        lookback_days=lookback,
+    )
+
+
+def _generate_brief(
+    config: ProjectConfig,
+    snapshot_path: Path,
+    company_filter: str | None,
+    lookback: int,
+    workers: int = 1,
+    reference: datetime | None = None,
+) -> Iterable[WeeklyBrief]:
+    reference = reference or _utcnow()
+    companies = [
+        company
+        for company in config.companies
+        if not company_filter or company.name.lower() == company_filter.lower()
+    ]
+
+    if workers > 1 and len(companies) > 1:
+        build = partial(
+            _build_company_brief_in_worker, lookback=lookback, reference=reference
         )
-        yield brief
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(companies)),
+            initializer=_init_worker,
+            initargs=(snapshot_path,),
+        ) as executor:
+            return list(executor.map(build, companies))
+
+    source = LocalSnapshotSource(snapshot_path=snapshot_path)
+    return [
+        _build_company_brief(company, source, lookback, reference)
+        for company in companies
+    ]
 
 
 def main(argv: Iterable[str] | None = None) -> int:
     args = parse_args(argv)
+    reference = _utcnow()
     config = load_config(args.config)
     lookback = args.lookback_days or config.lookback_days
 
@@ -99,19 +152,20 @@ def main(argv: Iterable[str] | None = None) -> int:
             snapshot_path=args.snapshot,
             company_filter=args.company,
             lookback=lookback,
+            workers=args.workers,
+            reference=reference,
         )
     )
     if not briefs:
         print("No companies matched the provided filters.")
         return 1
 
-    for brief in briefs:
-        if args.output:
-            args.output.write_text("\n".join(brief.report_lines), encoding="utf-8")
-            print(f"Brief written to {args.output}")
-        else:
-            print("\n".join(brief.report_lines))
-            print()
+    reports = [brief.report() for brief in briefs]
+    if args.output:
+        args.output.write_text("\n\n".join(reports), encoding="utf-8")
+        print(f"Brief written to {args.output}")
+    else:
+        print("\n\n".join(reports), end="\n\n")
 
     return 0
 
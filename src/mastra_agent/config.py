@@ -45,22 +45,21 @@ def load_config(path: str | Path) -> ProjectConfig:
     if not isinstance(companies_data, list):
         raise ValueError("Expected 'company' to be a list in the configuration file")
 
-    companies: List[CompanyConfig] = []
-    for entry in companies_data:
-        name = entry.get("name")
-        if not name:
-            raise ValueError("Each company entry must include a 'name'")
-        profiles_data = entry.get("profile", [])
-        profiles: List[LinkedInProfile] = []
-        for profile_entry in profiles_data:
-            profiles.append(
-                LinkedInProfile(
-                    name=profile_entry["name"],
-                    url=profile_entry["url"],
-                    title=profile_entry.get("title"),
-                    company=name,
-                )
-            )
-        companies.append(CompanyConfig(name=name, profiles=profiles))
-
+    companies = [_parse_company(entry) for entry in companies_data]
     return ProjectConfig(companies=companies, lookback_days=lookback_days)
+
+
+def _parse_company(entry: dict) -> CompanyConfig:
+    name = entry.get("name")
+    if not name:
+        raise ValueError("Each company entry must include a 'name'")
+    profiles = [
+        LinkedInProfile(
+            name=profile_entry["name"],
+            url=profile_entry["url"],
+            title=profile_entry.get("title"),
+            company=name,
+        )
+        for profile_entry in entry.get("profile", [])
+    ]
+    return CompanyConfig(name=name, profiles=profiles)
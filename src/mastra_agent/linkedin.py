@@ -2,15 +2,96 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import json
-from typing import Iterable, Iterator
+from operator import itemgetter
+from typing import Iterable, Iterator, Sequence
 
 from .models import LinkedInPost, LinkedInProfile
 
 
+_REQUIRED_FIELDS = itemgetter("content", "published_at")
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching snapshot timestamps."""
+
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(slots=True)
+class ProfilePostsTable:
+    """Column-oriented storage for one profile's snapshot posts.
+
+    Rows are addressed by their position in the snapshot. ``by_time`` lists the
+    row indices ordered by publication time and ``published_sorted`` holds the
+    matching timestamps so window lookups can use a binary search.
+    """
+
+    content: list[str]
+    published_at: list[datetime]
+    url: list[str | None]
+    reactions: list[int | None]
+    comments: list[int | None]
+    metadata: list[dict[str, str]]
+    by_time: list[int]
+    published_sorted: list[datetime]
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[dict]) -> ProfilePostsTable:
+        content: list[str] = []
+        published_at: list[datetime] = []
+        url: list[str | None] = []
+        reactions: list[int | None] = []
+        comments: list[int | None] = []
+        metadata: list[dict[str, str]] = []
+        for entry in entries:
+            entry_content, published_raw = _REQUIRED_FIELDS(entry)
+            content.append(entry_content)
+            published_at.append(datetime.fromisoformat(published_raw))
+            url.append(entry.get("url"))
+            reactions.append(entry.get("reactions"))
+            comments.append(entry.get("comments"))
+            metadata.append(entry.get("metadata") or {})
+
+        by_time = sorted(range(len(published_at)), key=published_at.__getitem__)
+        return cls(
+            content=content,
+            published_at=published_at,
+            url=url,
+            reactions=reactions,
+            comments=comments,
+            metadata=metadata,
+            by_time=by_time,
+            published_sorted=[published_at[index] for index in by_time],
+        )
+
+    def __len__(self) -> int:
+        return len(self.content)
+
+    def rows_since(self, cutoff: datetime) -> list[int]:
+        """Return indices of rows published since ``cutoff``, in snapshot order."""
+
+        start = bisect_left(self.published_sorted, cutoff)
+        return sorted(self.by_time[start:])
+
+    def row(self, profile: LinkedInProfile, index: int) -> LinkedInPost:
+        """Materialise a single row as a ``LinkedInPost`` bound to ``profile``."""
+
+        return LinkedInPost(
+            profile=profile,
+            content=self.content[index],
+            published_at=self.published_at[index],
+            url=self.url[index],
+            reactions=self.reactions[index],
+            comments=self.comments[index],
+            extra_metadata=self.metadata[index],
+        )
+
+
 @dataclass(slots=True)
 class LocalSnapshotSource:
     """Load LinkedIn posts from local JSON snapshots.
@@ -19,23 +100,53 @@ class LocalSnapshotSource:
     dictionaries. Each post dictionary must include a ``content`` field and a
     ``published_at`` ISO timestamp. Optional keys such as ``url``,
     ``reactions``, and ``comments`` are also supported.
+
+    The decoded snapshot is cached on the instance and reloaded only when the
+    file's modification time changes. A profile's entries are converted into a
+    ``ProfilePostsTable`` the first time that profile is requested, so entries
+    for profiles nobody asks about are never parsed. ``LinkedInPost`` objects
+    are only built for rows a caller asks for.
     """
 
     snapshot_path: Path
+    _cache: dict | None = field(default=None, init=False, repr=False, compare=False)
+    _cache_mtime: int | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _tables: dict[str, ProfilePostsTable] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def load_posts(self, profile: LinkedInProfile) -> Iterable[LinkedInPost]:
-        data = self._load_snapshot()
-        profile_posts = data.get(profile.url, [])
-        for entry in profile_posts:
-            yield self._convert_entry(profile, entry)
+        table = self._table_for(profile.url)
+        if table is None:
+            return
+        for index in range(len(table)):
+            yield table.row(profile, index)
 
     def iter_recent_posts(
-        self, profile: LinkedInProfile, lookback_days: int
+        self,
+        profile: LinkedInProfile,
+        lookback_days: int,
+        reference: datetime | None = None,
     ) -> Iterator[LinkedInPost]:
-        cutoff = datetime.utcnow() - timedelta(days=lookback_days)
-        for post in self.load_posts(profile):
-            if post.published_at >= cutoff:
-                yield post
+        reference = reference or _utcnow()
+        cutoff = reference - timedelta(days=lookback_days)
+        table = self._table_for(profile.url)
+        if table is None:
+            return
+        for index in table.rows_since(cutoff):
+            yield table.row(profile, index)
+
+    def _table_for(self, url: str) -> ProfilePostsTable | None:
+        data = self._load_snapshot()
+        table = self._tables.get(url)
+        if table is None:
+            entries = data.get(url)
+            if entries is None:
+                return None
+            table = self._tables[url] = ProfilePostsTable.from_entries(entries)
+        return table
 
     def _load_snapshot(self) -> dict:
         if not self.snapshot_path.exists():
@@ -43,35 +154,27 @@ class LocalSnapshotSource:
                 "Snapshot file not found. Please generate sample data using the"
                 " provided template in data/sample_posts.json"
             )
-        with self.snapshot_path.open("r", encoding="utf-8") as fp:
-            return json.load(fp)
-
-    @staticmethod
-    def _convert_entry(profile: LinkedInProfile, entry: dict) -> LinkedInPost:
-        published_raw = entry["published_at"]
-        published_at = datetime.fromisoformat(published_raw)
-        return LinkedInPost(
-            profile=profile,
-            content=entry["content"],
-            published_at=published_at,
-            url=entry.get("url"),
-            reactions=entry.get("reactions"),
-            comments=entry.get("comments"),
-            extra_metadata=entry.get("metadata", {}),
-        )
+        mtime = self.snapshot_path.stat().st_mtime_ns
+        if self._cache is None or self._cache_mtime != mtime:
+            # Release the stale snapshot first so a reload never holds two
+            # decoded copies of the file at once.
+            self._cache = None
+            self._tables = {}
+            self._cache = json.loads(self.snapshot_path.read_bytes())
+            self._cache_mtime = mtime
+        return self._cache
 
 
-def summarize_posts(posts: Iterable[LinkedInPost]) -> str:
+def summarize_posts(posts: Sequence[LinkedInPost]) -> str:
     """Create a natural language summary from a collection of posts."""
 
-    posts_list = list(posts)
-    if not posts_list:
+    if not posts:
         return "No public signals identified during the selected period."
 
     lines: list[str] = []
-    for post in posts_list:
+    for post in posts:
         profile = post.profile
-        timestamp = post.published_at.strftime("%d %b %Y")
+        timestamp = post.published_display_date
         headline = post.content.strip().split("\n", 1)[0][:120]
         lines.append(
             f"{profile.company or 'Unknown company'} · {profile.name} ({timestamp}): {headline}"
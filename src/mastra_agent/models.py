@@ -4,7 +4,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterable, List
+from typing import List
+
+
+_MONTH_ABBR = (
+    "", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
 
 
 @dataclass(slots=True)
@@ -32,6 +38,31 @@ class LinkedInPost:
     reactions: int | None = None
     comments: int | None = None
     extra_metadata: dict[str, str] = field(default_factory=dict)
+    _content_lower: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def content_lower(self) -> str:
+        """Lowercased post content, computed on first access and cached."""
+
+        if self._content_lower is None:
+            self._content_lower = self.content.lower()
+        return self._content_lower
+
+    @property
+    def published_iso_date(self) -> str:
+        """Publication date formatted as ``YYYY-MM-DD``."""
+
+        published = self.published_at
+        return f"{published.year:04d}-{published.month:02d}-{published.day:02d}"
+
+    @property
+    def published_display_date(self) -> str:
+        """Publication date formatted as ``DD Mon YYYY``."""
+
+        published = self.published_at
+        return f"{published.day:02d} {_MONTH_ABBR[published.month]} {published.year}"
 
 
 @dataclass(slots=True)
@@ -52,53 +83,60 @@ class WeeklyBrief:
     hiring_signals: List[HiringSignal]
     summary: str
 
-    @property
-    def report_lines(self) -> Iterable[str]:
-        """Yield lines for a textual report."""
+    def report(self) -> str:
+        """Render the brief as a textual report."""
 
-        yield f"Weekly brief for {self.company}"
-        yield "=" * (len(self.company) + 14)
-        yield ""
+        parts: List[str] = [
+            f"Weekly brief for {self.company}",
+            "=" * (len(self.company) + 14),
+            "",
+        ]
 
         if not self.posts:
-            yield "No posts captured for the selected period."
-            return
+            parts.append("No posts captured for the selected period.")
+            return "\n".join(parts)
 
-        yield "Key profiles monitored:"
+        parts.append("Key profiles monitored:")
         for profile in self.profiles:
-            descriptor = f"- {profile.name}"
             if profile.title:
-                descriptor += f", {profile.title}"
-            yield descriptor
-        yield ""
+                parts.append(f"- {profile.name}, {profile.title}")
+            else:
+                parts.append(f"- {profile.name}")
+        parts.append("")
 
-        yield "Highlighted posts:"
+        parts.append("Highlighted posts:")
         for post in self.posts:
-            timestamp = post.published_at.strftime("%Y-%m-%d")
-            yield f"- {timestamp}: {post.profile.name}"
+            parts.append(f"- {post.published_iso_date}: {post.profile.name}")
             snippet = post.content.strip().replace("\n", " ")
-            yield f"  {snippet[:180]}{'…' if len(snippet) > 180 else ''}"
+            parts.append(f"  {snippet[:180]}{'…' if len(snippet) > 180 else ''}")
             if post.url:
-                yield f"  Link: {post.url}"
+                parts.append(f"  Link: {post.url}")
             if post.reactions is not None or post.comments is not None:
                 metrics = []
                 if post.reactions is not None:
                     metrics.append(f"{post.reactions} reactions")
                 if post.comments is not None:
                     metrics.append(f"{post.comments} comments")
-                yield "  Metrics: " + ", ".join(metrics)
+                parts.append("  Metrics: " + ", ".join(metrics))
             if post.extra_metadata:
                 metadata_str = ", ".join(
                     f"{key}={value}" for key, value in post.extra_metadata.items()
                 )
-                yield f"  Metadata: {metadata_str}"
-            yield ""
+                parts.append(f"  Metadata: {metadata_str}")
+            parts.append("")
 
         if self.hiring_signals:
-            yield "Hiring and capability signals:"
+            parts.append("Hiring and capability signals:")
             for signal in self.hiring_signals:
-                yield f"- {signal.summary}"
-            yield ""
+                parts.append(f"- {signal.summary}")
+            parts.append("")
+
+        parts.append("Summary:")
+        parts.append(self.summary)
+        return "\n".join(parts)
+
+    @property
+    def report_lines(self) -> List[str]:
+        """Lines of the textual report, kept for backwards compatibility."""
 
-        yield "Summary:"
-        yield self.summary
+        return self.report().split("\n")